@@ -1,5 +1,4 @@
 import re
-from copy import deepcopy
 
 import ayon_api
 
@@ -30,6 +29,7 @@ class ShotMetadataSolver:
         }
         self.shot_add_tasks = []
         self.log = logger
+        self._tokenizer_patterns = None
 
     def update_data(
         self,
@@ -42,6 +42,33 @@ class ShotMetadataSolver:
         self.shot_rename = shot_rename
         self.shot_hierarchy = shot_hierarchy
         self.shot_add_tasks = shot_add_tasks
+        self._tokenizer_patterns = None
+
+    def _get_tokenizer_patterns(self):
+        """Compiled clip name tokenizer patterns.
+
+        Patterns are compiled only once per settings update and not for
+        each processed clip.
+
+        Returns:
+            list[tuple[str, str, re.Pattern]]: Token key, source regex
+                and compiled pattern.
+        """
+        if self._tokenizer_patterns is None:
+            tokenizer_patterns = []
+            for item in self.clip_name_tokenizer:
+                pattern = item["regex"]
+                try:
+                    compiled = re.compile(pattern)
+                except re.error as exc:
+                    raise CreatorError(
+                        f"Invalid regex '{pattern}' of token"
+                        f" '{item['name']}' in clip name tokenizer"
+                        f" settings: {exc}"
+                    )
+                tokenizer_patterns.append((item["name"], pattern, compiled))
+            self._tokenizer_patterns = tokenizer_patterns
+        return self._tokenizer_patterns
 
     def _rename_template(self, data):
         """Shot renaming function
@@ -83,7 +110,8 @@ class ShotMetadataSolver:
         Returns:
             dict: updated source_data
         """
-        output_data = deepcopy(source_data["anatomy_data"])
+        # Only top level keys are added, nested data are not modified
+        output_data = dict(source_data["anatomy_data"])
         output_data["clip_name"] = clip_name
 
         if not self.clip_name_tokenizer:
@@ -93,10 +121,7 @@ class ShotMetadataSolver:
 
         search_text = parent_name + clip_name
 
-        for clip_name_item in self.clip_name_tokenizer:
-            token_key = clip_name_item["name"]
-            pattern = clip_name_item["regex"]
-            p = re.compile(pattern)
+        for token_key, pattern, p in self._get_tokenizer_patterns():
             match = p.findall(search_text)
             if not match:
                 raise CreatorError((
@@ -130,7 +155,7 @@ class ShotMetadataSolver:
             list: list of dict of parent components
         """
         # fill the parents parts from presets
-        shot_hierarchy = deepcopy(self.shot_hierarchy)
+        shot_hierarchy = self.shot_hierarchy
         hierarchy_parents = shot_hierarchy["parents"]
 
         # fill parent keys data template from anatomy data
@@ -263,12 +288,14 @@ class ShotMetadataSolver:
             "entity_type": "project",
             "entity_name": project_name,
         }]
-        for entity in folders_hierarchy:
-            output.append({
+        output.extend(
+            {
                 "entity_type": "folder",
                 "folder_type": entity["folderType"],
                 "entity_name": entity["name"]
-            })
+            }
+            for entity in folders_hierarchy
+        )
         return output
 
     def _generate_tasks_from_settings(self, project_entity):
@@ -25,9 +25,8 @@ REVIEW_EXTENSIONS = set(IMAGE_EXTENSIONS) | set(VIDEO_EXTENSIONS)
 SHARED_DATA_KEY = "ayon.traypublisher.instances"
 
 
-class HiddenTrayPublishCreator(HiddenCreator):
-    host_name = "traypublisher"
-    settings_category = "traypublisher"
+class _TrayPublishCreatorMixin:
+    """Instance storage logic shared by tray publisher creators."""
 
     def collect_instances(self):
         instances_by_identifier = cache_and_get_instances(
@@ -45,6 +44,11 @@ class HiddenTrayPublishCreator(HiddenCreator):
         for instance in instances:
             self._remove_instance_from_context(instance)
 
+
+class HiddenTrayPublishCreator(_TrayPublishCreatorMixin, HiddenCreator):
+    host_name = "traypublisher"
+    settings_category = "traypublisher"
+
     def _store_new_instance(self, new_instance):
         """Tray publisher specific method to store instance.
 
@@ -61,27 +65,11 @@ class HiddenTrayPublishCreator(HiddenCreator):
         self._add_instance_to_context(new_instance)
 
 
-class TrayPublishCreator(Creator):
+class TrayPublishCreator(_TrayPublishCreatorMixin, Creator):
     create_allow_context_change = True
     host_name = "traypublisher"
     settings_category = "traypublisher"
 
-    def collect_instances(self):
-        instances_by_identifier = cache_and_get_instances(
-            self, SHARED_DATA_KEY, list_instances
-        )
-        for instance_data in instances_by_identifier[self.identifier]:
-            instance = CreatedInstance.from_existing(instance_data, self)
-            self._add_instance_to_context(instance)
-
-    def update_instances(self, update_list):
-        update_instances(update_list)
-
-    def remove_instances(self, instances):
-        remove_instances(instances)
-        for instance in instances:
-            self._remove_instance_from_context(instance)
-
     def _store_new_instance(self, new_instance):
         """Tray publisher specific method to store instance.
 
@@ -84,12 +84,17 @@ def parse_with_version(
 
 def parse_containing(project_name, folder_name, all_selected_folder_ids=None):
     """Look if file name contains any existing folder name"""
+    # Empty name can't contain any folder name, skip query of all folders
+    if not folder_name:
+        return None
+
+    folder_name_low = folder_name.lower()
     for folder_entity in ayon_api.get_folders(
         project_name,
         folder_ids=all_selected_folder_ids,
         fields={"id", "name"}
     ):
-        if folder_entity["name"].lower() in folder_name.lower():
+        if folder_entity["name"].lower() in folder_name_low:
             return ayon_api.get_folder_by_id(
                 project_name,
                 folder_entity["id"]
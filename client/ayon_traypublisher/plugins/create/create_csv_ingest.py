@@ -18,69 +18,101 @@ from ayon_core.lib.transcoding import (
 from ayon_core.pipeline.create import CreatorError
 from ayon_traypublisher.api.plugin import TrayPublishCreator
 
+# Printf style frame padding in file name e.g. 'file.%04d.exr'
+SEQUENCE_PADDING_REGEX = re.compile(r"%\d+d|%d")
+
+
+def _convert_number(value: Optional[str]) -> Optional[int]:
+    return None if value is None else int(value)
+
+
+def _convert_decimal(value: Optional[str]) -> Optional[float]:
+    return None if value is None else float(value)
+
+
+def _convert_bool(value: Optional[str]) -> bool:
+    return value in ("true", "True")
+
+
+# Column value converters by column type, 'text' values are kept as are
+COLUMN_VALUE_CONVERTERS = {
+    "number": _convert_number,
+    "decimal": _convert_decimal,
+    "bool": _convert_bool,
+}
+
+
+class ColumnItem:
+    """Column configuration resolved once per applied settings.
+
+    Args:
+        column_data (Dict[str, Any]): Column item from settings.
+    """
+    def __init__(self, column_data: Dict[str, Any]):
+        column_type = column_data["type"]
+        default = column_data["default"]
+        if column_type in ("number", "decimal") and default in (0, "0"):
+            default = None
+
+        self.name = column_data["name"]
+        self.type = column_type
+        self.converter = COLUMN_VALUE_CONVERTERS.get(column_type)
+        self.default = default
+        self.required = column_data["required_column"]
+        self.validation_pattern = str(column_data["validation_pattern"])
+        try:
+            self.validation_regex = re.compile(self.validation_pattern)
+        except re.error as exc:
+            raise CreatorError(
+                f"Invalid validation pattern '{self.validation_pattern}'"
+                f" of column '{self.name}': {exc}"
+            )
+        self.data = column_data
+
 
 def _get_row_value_with_validation(
-    columns_config: Dict[str, Any],
+    columns_by_name: Dict[str, ColumnItem],
     column_name: str,
     row_data: Dict[str, Any],
 ):
     """Get row value with validation"""
 
     # get column data from column config
-    column_data = None
-    for column in columns_config["columns"]:
-        if column["name"] == column_name:
-            column_data = column
-            break
-
-    if not column_data:
+    column_item = columns_by_name.get(column_name)
+    if not column_item:
         raise CreatorError(
             f"Column '{column_name}' not found in column config."
         )
 
     # get column value from row
     column_value = row_data.get(column_name)
-    column_required = column_data["required_column"]
 
     # check if column value is not empty string and column is required
-    if column_value == "" and column_required:
+    if column_value == "" and column_item.required:
         raise CreatorError(
             f"Value in column '{column_name}' is required."
         )
 
-    # get column type
-    column_type = column_data["type"]
-    # get column validation regex
-    column_validation = column_data["validation_pattern"]
-    # get column default value
-    column_default = column_data["default"]
-
-    if column_type in ["number", "decimal"] and column_default in (0, '0'):
-        column_default = None
-
     # check if column value is not empty string
     if column_value == "":
         # set default value if column value is empty string
-        column_value = column_default
+        column_value = column_item.default
 
     # set column value to correct type following column type
-    if column_type == "number" and column_value is not None:
-        column_value = int(column_value)
-    elif column_type == "decimal" and column_value is not None:
-        column_value = float(column_value)
-    elif column_type == "bool":
-        column_value = column_value in ["true", "True"]
+    if column_item.converter is not None:
+        column_value = column_item.converter(column_value)
 
     # check if column value matches validation regex
     if (
-        column_value is not None and
-        not re.match(str(column_validation), str(column_value))
+        column_value is not None
+        and not column_item.validation_regex.match(str(column_value))
     ):
         raise CreatorError(
             f"Column '{column_name}' value '{column_value}'"
-            f" does not match validation regex '{column_validation}'"
+            " does not match validation regex"
+            f" '{column_item.validation_pattern}'"
             f"\nRow data: {row_data}"
-            f"\nColumn data: {column_data}"
+            f"\nColumn data: {column_item.data}"
         )
 
     return column_value
@@ -116,10 +148,10 @@ class RepreItem:
         self.tags = tags
 
     @classmethod
-    def from_csv_row(cls, columns_config, repre_config, row):
+    def from_csv_row(cls, columns_by_name, repre_config, row):
         kwargs = {
             dst_key: _get_row_value_with_validation(
-                columns_config, column_name, row
+                columns_by_name, column_name, row
             )
             for dst_key, column_name in (
                 # Representation information
@@ -211,10 +243,10 @@ class ProductItem:
         self.repre_items.append(repre_item)
 
     @classmethod
-    def from_csv_row(cls, columns_config, row):
+    def from_csv_row(cls, columns_by_name, row):
         kwargs = {
             dst_key: _get_row_value_with_validation(
-                columns_config, column_name, row
+                columns_by_name, column_name, row
             )
             for dst_key, column_name in (
                 # Context information
@@ -253,6 +285,47 @@ configuration in project settings.
     representations_config = {}
     folder_creation_config = {}
 
+    # resolved lazily from settings on first use
+    _columns_by_name = None
+    _extensions_by_repre_name = None
+    _folder_type_regexes = None
+    _task_type_regexes = None
+
+    def _get_columns_by_name(self) -> Dict[str, ColumnItem]:
+        # Resolve column config once per creator and not for each
+        #   ingested CSV file
+        if self._columns_by_name is None:
+            self._columns_by_name = {
+                column["name"]: ColumnItem(column)
+                for column in self.columns_config.get("columns", [])
+            }
+        return self._columns_by_name
+
+    def _get_extensions_by_repre_name(self) -> Dict[str, Set[str]]:
+        if self._extensions_by_repre_name is None:
+            self._extensions_by_repre_name = {
+                repre["name"]: {ext.lower() for ext in repre["extensions"]}
+                for repre in self.representations_config.get(
+                    "representations", []
+                )
+            }
+        return self._extensions_by_repre_name
+
+    def _compile_type_regexes(self, key: str, type_key: str) -> list:
+        # Compiled regexes with their types in settings order, first
+        #   matching regex wins
+        output = []
+        for item in self.folder_creation_config.get(key, []):
+            try:
+                regex = re.compile(item["regex"])
+            except re.error as exc:
+                raise CreatorError(
+                    f"Invalid regex '{item['regex']}' in folder creation"
+                    f" settings: {exc}"
+                )
+            output.append((regex, item[type_key]))
+        return output
+
     def get_instance_attr_defs(self):
         return [
             BoolDef(
@@ -400,9 +473,12 @@ configuration in project settings.
         Returns:
             str. The folder type to use.
         """
-        for folder_setting in self.folder_creation_config["folder_type_regexes"]:
-            if re.match(folder_setting["regex"], folder_name):
-                folder_type = folder_setting["folder_type"]
+        if self._folder_type_regexes is None:
+            self._folder_type_regexes = self._compile_type_regexes(
+                "folder_type_regexes", "folder_type"
+            )
+        for regex, folder_type in self._folder_type_regexes:
+            if regex.match(folder_name):
                 return folder_type
 
         return self.folder_creation_config["folder_create_type"]
@@ -472,11 +548,12 @@ configuration in project settings.
         project_name = self.create_context.get_current_project_name()
         csv_path = os.path.join(csv_dir, filename)
 
+        columns_by_name = self._get_columns_by_name()
         # make sure csv file contains columns from following list
         required_columns = [
-            column["name"]
-            for column in self.columns_config["columns"]
-            if column["required_column"]
+            column_name
+            for column_name, column_item in columns_by_name.items()
+            if column_item.required
         ]
 
         # read csv file
@@ -509,7 +586,7 @@ configuration in project settings.
         product_items_by_name: Dict[str, ProductItem] = {}
         for row in csv_reader:
             _product_item: ProductItem = ProductItem.from_csv_row(
-                self.columns_config, row
+                columns_by_name, row
             )
             unique_name = _product_item.unique_name
             if unique_name not in product_items_by_name:
@@ -517,7 +594,7 @@ configuration in project settings.
             product_item: ProductItem = product_items_by_name[unique_name]
             product_item.add_repre_item(
                 RepreItem.from_csv_row(
-                    self.columns_config,
+                    columns_by_name,
                     self.representations_config,
                     row
                 )
@@ -708,44 +785,38 @@ configuration in project settings.
         extension: str = os.path.splitext(basename)[-1].lower()
 
         # validate filepath is having correct extension based on output
-        repre_config_data: Union[Dict[str, Any], None] = None
-        for repre in self.representations_config["representations"]:
-            if repre["name"] == repre_item.name:
-                repre_config_data = repre
-                break
-
-        if not repre_config_data:
+        validate_extensions: Union[Set[str], None] = (
+            self._get_extensions_by_repre_name().get(repre_item.name)
+        )
+        if validate_extensions is None:
             raise CreatorError(
                 f"Representation '{repre_item.name}' not found "
                 "in config representation data."
             )
 
-        validate_extensions: List[str] = repre_config_data["extensions"]
         if extension not in validate_extensions:
             raise CreatorError(
                 f"File extension '{extension}' not valid for "
-                f"output '{validate_extensions}'."
+                f"output '{sorted(validate_extensions)}'."
             )
 
         is_sequence: bool = extension in IMAGE_EXTENSIONS
         # convert ### string in file name to %03d
         # this is for correct frame range validation
         # example: file.###.exr -> file.%03d.exr
-        file_head = basename.split(".")[0]
+        file_head = basename.partition(".")[0]
         if "#" in basename:
-            padding = len(basename.split("#")) - 1
+            padding = basename.count("#")
             seq_padding = f"%0{padding}d"
             basename = basename.replace("#" * padding, seq_padding)
-            file_head = basename.split(seq_padding)[0]
+            file_head = basename.partition(seq_padding)[0]
             is_sequence = True
         elif "%" in basename:
-            pattern = re.compile(r"%\d+d|%d")
-            padding = pattern.findall(basename)
-            if not padding:
+            if not SEQUENCE_PADDING_REGEX.search(basename):
                 raise CreatorError(
                     f"File sequence padding not found in '{basename}'."
                 )
-            file_head = basename.split("%")[0]
+            file_head = basename.partition("%")[0]
             is_sequence = True
         else:
             # in case it is still image
@@ -854,9 +925,12 @@ configuration in project settings.
         Returns:
             str. The task type computed from settings.
         """
-        for task_setting in self.folder_creation_config["task_type_regexes"]:
-            if re.match(task_setting["regex"], task_name):
-                task_type = task_setting["task_type"]
+        if self._task_type_regexes is None:
+            self._task_type_regexes = self._compile_type_regexes(
+                "task_type_regexes", "task_type"
+            )
+        for regex, task_type in self._task_type_regexes:
+            if regex.match(task_name):
                 break
         else:
             task_type = self.folder_creation_config["task_create_type"]
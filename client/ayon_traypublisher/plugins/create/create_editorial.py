@@ -193,16 +193,19 @@ or updating already created. Publishing will create OTIO file.
 """
     icon = "fa.file"
     product_type_presets = []
+    # Pre-create attribute definitions are rebuilt only on settings change
+    _pre_create_attr_defs = None
 
     def __init__(self, *args, **kwargs):
         self._shot_metadata_solver = ShotMetadataSolver(self.log)
         super(EditorialSimpleCreator, self).__init__(*args, **kwargs)
 
     def apply_settings(self, project_settings):
-        editorial_creators = deepcopy(
+        # Copy only settings of this creator
+        editorial_creators = (
             project_settings["traypublisher"]["editorial_creators"]
         )
-        creator_settings = editorial_creators.get(self.identifier)
+        creator_settings = deepcopy(editorial_creators.get(self.identifier))
 
         self._shot_metadata_solver.update_data(
             creator_settings["clip_name_tokenizer"],
@@ -211,6 +214,7 @@ or updating already created. Publishing will create OTIO file.
             creator_settings["shot_add_tasks"]
         )
         self.product_type_presets = creator_settings["product_type_presets"]
+        self._pre_create_attr_defs = None
         default_variants = creator_settings.get("default_variants")
         if default_variants:
             self.default_variants = default_variants
@@ -234,6 +238,8 @@ or updating already created. Publishing will create OTIO file.
         folder_entity = ayon_api.get_folder_by_path(
             self.project_name, folder_path
         )
+        # Project entity is same for all clips
+        project_entity = ayon_api.get_project(self.project_name)
 
         if pre_create_data["fps"] == "from_selection":
             # get 'fps' from folder attributes
@@ -252,6 +258,9 @@ or updating already created. Publishing will create OTIO file.
         sequence_paths = self._get_path_from_file_data(
             sequence_path_data, multi=True)
         media_path = self._get_path_from_file_data(media_path_data)
+        # media data for audio stream and reference solving
+        # - probe media file only once for all sequence files
+        media_data = self._get_media_source_metadata(media_path)
 
         first_otio_timeline = None
         for seq_path in sequence_paths:
@@ -267,9 +276,11 @@ or updating already created. Publishing will create OTIO file.
 
             # create clip instances
             self._get_clip_instances(
+                project_entity,
                 folder_entity,
                 otio_timeline,
                 media_path,
+                media_data,
                 clip_instance_properties,
                 allowed_product_type_presets,
                 os.path.basename(seq_path),
@@ -368,9 +379,11 @@ or updating already created. Publishing will create OTIO file.
 
     def _get_clip_instances(
         self,
+        project_entity,
         folder_entity,
         otio_timeline,
         media_path,
+        media_data,
         instance_data,
         product_type_presets,
         sequence_file_name,
@@ -379,18 +392,17 @@ or updating already created. Publishing will create OTIO file.
         """Helping function for creating clip instance
 
         Args:
+            project_entity (dict[str, Any]): Project entity.
             folder_entity (dict[str, Any]): Folder entity.
             otio_timeline (otio.Timeline): otio timeline object
             media_path (str): media file path string
+            media_data (dict): media metadata
             instance_data (dict): clip instance data
             product_type_presets (list): list of dict settings product presets
         """
 
         tracks = otio_timeline.video_tracks()
 
-        # media data for audio stream and reference solving
-        media_data = self._get_media_source_metadata(media_path)
-
         for track in tracks:
             # set track name
             track.name = f"{sequence_file_name} - {otio_timeline.name}"
@@ -417,6 +429,7 @@ or updating already created. Publishing will create OTIO file.
                     otio_clip,
                     instance_data,
                     track_start_frame,
+                    project_entity,
                     folder_entity
                 )
 
@@ -504,23 +517,21 @@ or updating already created. Publishing will create OTIO file.
                 path, self.log
             )
 
-            # get video stream data
-            video_streams = []
-            audio_streams = []
-            for stream in media_data["streams"]:
-                codec_type = stream.get("codec_type")
-                if codec_type == "audio":
-                    audio_streams.append(stream)
-
-                elif codec_type == "video":
-                    video_streams.append(stream)
-
-            if not video_streams:
+            streams = media_data["streams"]
+            # get first video stream data
+            video_stream = next(
+                (
+                    stream
+                    for stream in streams
+                    if stream.get("codec_type") == "video"
+                ),
+                None
+            )
+            if video_stream is None:
                 raise ValueError(
                     "Could not find video stream in source file."
                 )
 
-            video_stream = video_streams[0]
             return_data = {
                 "video": True,
                 "start_frame": 0,
@@ -533,7 +544,10 @@ or updating already created. Publishing will create OTIO file.
             }
 
             # get audio  streams data
-            if audio_streams:
+            if any(
+                stream.get("codec_type") == "audio"
+                for stream in streams
+            ):
                 return_data["audio"] = True
 
         except Exception as exc:
@@ -618,13 +632,8 @@ or updating already created. Publishing will create OTIO file.
         _variant_name = product_type_preset.get("variant") or variant_name
 
         # product name
-        product_name = "{}{}".format(
-            product_type, _variant_name.capitalize()
-        )
-        label = "{} {}".format(
-            folder_path,
-            product_name
-        )
+        product_name = product_type + _variant_name.capitalize()
+        label = f"{folder_path} {product_name}"
 
         instance_data.update({
             "label": label,
@@ -640,6 +649,7 @@ or updating already created. Publishing will create OTIO file.
         otio_clip,
         instance_data,
         track_start_frame,
+        project_entity,
         folder_entity,
     ):
         """Factoring basic set of instance data.
@@ -648,6 +658,8 @@ or updating already created. Publishing will create OTIO file.
             otio_clip (otio.Clip): otio clip object
             instance_data (dict): precreate instance data
             track_start_frame (int): track start frame
+            project_entity (dict[str, Any]): Project entity.
+            folder_entity (dict[str, Any]): Selected folder entity.
 
         Returns:
             dict: instance data
@@ -666,7 +678,6 @@ or updating already created. Publishing will create OTIO file.
 
         # basic unique folder name
         clip_name = os.path.splitext(otio_clip.name)[0]
-        project_entity = ayon_api.get_project(self.project_name)
 
         shot_name, shot_metadata = self._shot_metadata_solver.generate_data(
             clip_name,
@@ -830,6 +841,11 @@ or updating already created. Publishing will create OTIO file.
         Returns:
             list: list of attribute object instances
         """
+        if self._pre_create_attr_defs is None:
+            self._pre_create_attr_defs = self._create_pre_create_attr_defs()
+        return list(self._pre_create_attr_defs)
+
+    def _create_pre_create_attr_defs(self):
         # Use same attributes as for instance attrobites
         attr_defs = [
             FileDef(
@@ -1,4 +1,3 @@
-import copy
 import os
 import re
 import collections
@@ -45,6 +44,11 @@ class BatchMovieCreator(TrayPublishCreator):
         )
         self.default_variants = creator_settings["default_variants"]
         self.default_tasks = creator_settings["default_tasks"]
+        # Task names are matched case insensitive
+        self._default_task_names = [
+            task_name.lower()
+            for task_name in self.default_tasks
+        ]
         self.extensions = creator_settings["extensions"]
 
     def get_icon(self):
@@ -55,22 +59,28 @@ class BatchMovieCreator(TrayPublishCreator):
         if not file_paths:
             return
 
+        project_name = self.project_name
+        version_regex = self.version_regex
         data_by_folder_id = collections.defaultdict(list)
         for file_info in file_paths:
-            instance_data = copy.deepcopy(data)
+            # Shallow copy is enough, nested values are not modified here
+            instance_data = dict(data)
+            if "families" in instance_data:
+                instance_data["families"] = list(instance_data["families"])
             file_name = file_info["filenames"][0]
             filepath = os.path.join(file_info["directory"], file_name)
             instance_data["creator_attributes"] = {"filepath": filepath}
 
             folder_entity, version = get_folder_entity_from_filename(
-                self.project_name, file_name, self.version_regex)
+                project_name, file_name, version_regex)
             data_by_folder_id[folder_entity["id"]].append(
                 (instance_data, folder_entity)
             )
 
         all_task_entities = ayon_api.get_tasks(
-            self.project_name, task_ids=set(data_by_folder_id.keys())
+            project_name, task_ids=set(data_by_folder_id.keys())
         )
+        variant = data["variant"]
         task_entity_by_folder_id = collections.defaultdict(dict)
         for task_entity in all_task_entities:
             folder_id = task_entity["folderId"]
@@ -83,15 +93,14 @@ class BatchMovieCreator(TrayPublishCreator):
             task_entities_by_name = task_entity_by_folder_id[folder_id]
             task_name = None
             task_entity = None
-            for default_task_name in self.default_tasks:
-                _name = default_task_name.lower()
+            for _name in self._default_task_names:
                 if _name in task_entities_by_name:
                     task_name = task_entity["name"]
                     task_entity = task_entities_by_name[_name]
                     break
 
             product_name = self._get_product_name(
-                self.project_name, task_entity, data["variant"]
+                project_name, task_entity, variant
             )
 
             instance_data["folderPath"] = folder_entity["path"]
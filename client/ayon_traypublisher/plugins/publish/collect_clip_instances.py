@@ -1,7 +1,18 @@
+import logging
 from pprint import pformat
+
 import pyblish.api
 
 
+EDITORIAL_CLIP_IDENTIFIERS = frozenset({
+    "editorial_plate",
+    "editorial_audio",
+    "editorial_review",
+})
+# Marker for missing values, value stored in data can be 'None'
+_MISSING = object()
+
+
 class CollectClipInstance(pyblish.api.InstancePlugin):
     """Collect clip instances and resolve its parent"""
 
@@ -12,25 +23,26 @@ class CollectClipInstance(pyblish.api.InstancePlugin):
     families = ["plate", "review", "audio"]
 
     def process(self, instance):
-        creator_identifier = instance.data["creator_identifier"]
-        if creator_identifier not in [
-            "editorial_plate",
-            "editorial_audio",
-            "editorial_review"
-        ]:
+        instance_data = instance.data
+        creator_identifier = instance_data["creator_identifier"]
+        if creator_identifier not in EDITORIAL_CLIP_IDENTIFIERS:
             return
 
-        instance.data["families"].append("clip")
+        context_data = instance.context.data
+        families = instance_data["families"]
+        families.append("clip")
 
-        parent_instance_id = instance.data["parent_instance_id"]
-        edit_shared_data = instance.context.data["editorialSharedData"]
-        instance.data.update(
+        parent_instance_id = instance_data["parent_instance_id"]
+        edit_shared_data = context_data["editorialSharedData"]
+        instance_data.update(
             edit_shared_data[parent_instance_id]
         )
 
-        if "editorialSourcePath" in instance.context.data.keys():
-            instance.data["editorialSourcePath"] = (
-                instance.context.data["editorialSourcePath"])
-            instance.data["families"].append("trimming")
+        editorial_source_path = context_data.get(
+            "editorialSourcePath", _MISSING)
+        if editorial_source_path is not _MISSING:
+            instance_data["editorialSourcePath"] = editorial_source_path
+            families.append("trimming")
 
-        self.log.debug(pformat(instance.data))
+        if self.log.isEnabledFor(logging.DEBUG):
+            self.log.debug(pformat(instance_data))
@@ -1,9 +1,13 @@
 import os
+import logging
 from pprint import pformat
 import pyblish.api
 from ayon_core.pipeline import publish
 from ayon_core.pipeline import colorspace
 
+# Symbols in LUT file name replaced by space to split output name parts
+OUTPUT_NAME_TRANSLATION = str.maketrans("_.-", "   ")
+
 
 class CollectColorspaceLook(pyblish.api.InstancePlugin,
                             publish.AYONPyblishPluginMixin):
@@ -20,16 +24,17 @@ class CollectColorspaceLook(pyblish.api.InstancePlugin,
 
         lut_repre_name = "LUTfile"
         file_url = creator_attrs["abs_lut_path"]
-        file_name = os.path.basename(file_url)
+        staging_dir, file_name = os.path.split(file_url)
         base_name, ext = os.path.splitext(file_name)
+        ext = ext.lstrip(".")
 
         # set output name with base_name which was cleared
         # of all symbols and all parts were capitalized
-        output_name = (base_name.replace("_", " ")
-                                .replace(".", " ")
-                                .replace("-", " ")
-                                .title()
-                                .replace(" ", ""))
+        output_name = (
+            base_name.translate(OUTPUT_NAME_TRANSLATION)
+            .title()
+            .replace(" ", "")
+        )
 
         # get config items
         config_items = instance.data["transientData"]["config_items"]
@@ -37,17 +42,17 @@ class CollectColorspaceLook(pyblish.api.InstancePlugin,
 
         # get colorspace items
         converted_color_data = {}
-        for colorspace_key in [
+        for colorspace_key in (
             "working_colorspace",
             "input_colorspace",
             "output_colorspace"
-        ]:
-            if creator_attrs[colorspace_key]:
+        ):
+            color_data = None
+            enum_value = creator_attrs[colorspace_key]
+            if enum_value:
                 color_data = colorspace.convert_colorspace_enumerator_item(
-                    creator_attrs[colorspace_key], config_items)
-                converted_color_data[colorspace_key] = color_data
-            else:
-                converted_color_data[colorspace_key] = None
+                    enum_value, config_items)
+            converted_color_data[colorspace_key] = color_data
 
         # add colorspace to config data
         if converted_color_data["working_colorspace"]:
@@ -59,9 +64,9 @@ class CollectColorspaceLook(pyblish.api.InstancePlugin,
         lut_repre = {
             "name": lut_repre_name,
             "output": output_name,
-            "ext": ext.lstrip("."),
+            "ext": ext,
             "files": file_name,
-            "stagingDir": os.path.dirname(file_url),
+            "stagingDir": staging_dir,
             "tags": []
         }
         instance.data.update({
@@ -71,7 +76,7 @@ class CollectColorspaceLook(pyblish.api.InstancePlugin,
             "ocioLookItems": [
                 {
                     "name": lut_repre_name,
-                    "ext": ext.lstrip("."),
+                    "ext": ext,
                     "input_colorspace": converted_color_data[
                         "input_colorspace"],
                     "output_colorspace": converted_color_data[
@@ -83,4 +88,5 @@ class CollectColorspaceLook(pyblish.api.InstancePlugin,
             ],
         })
 
-        self.log.debug(pformat(instance.data))
+        if self.log.isEnabledFor(logging.DEBUG):
+            self.log.debug(pformat(instance.data))
@@ -1,4 +1,5 @@
 import os
+import logging
 from pprint import pformat
 import pyblish.api
 import opentimelineio as otio
@@ -43,6 +44,7 @@ class CollectEditorialInstance(pyblish.api.InstancePlugin):
             "files": os.path.basename(fpath)
         })
 
-        self.log.debug("Created Editorial Instance {}".format(
-            pformat(instance.data)
-        ))
+        if self.log.isEnabledFor(logging.DEBUG):
+            self.log.debug("Created Editorial Instance {}".format(
+                pformat(instance.data)
+            ))
@@ -1,6 +1,13 @@
 import pyblish.api
 
 
+EDITORIAL_CLIP_IDENTIFIERS = frozenset({
+    "editorial_plate",
+    "editorial_audio",
+    "editorial_review",
+})
+
+
 class CollectEditorialReviewable(pyblish.api.InstancePlugin):
     """ Collect review input from user.
 
@@ -15,16 +22,16 @@ class CollectEditorialReviewable(pyblish.api.InstancePlugin):
 
     def process(self, instance):
         creator_identifier = instance.data["creator_identifier"]
-        if creator_identifier not in [
-            "editorial_plate",
-            "editorial_audio",
-            "editorial_review"
-        ]:
+        if creator_identifier not in EDITORIAL_CLIP_IDENTIFIERS:
             return
 
         creator_attributes = instance.data["creator_attributes"]
 
-        if creator_attributes["add_review_family"]:
-            instance.data["families"].append("review")
+        families = instance.data["families"]
+        if (
+            creator_attributes["add_review_family"]
+            and "review" not in families
+        ):
+            families.append("review")
 
-        self.log.debug("instance.data {}".format(instance.data))
+        self.log.debug("instance.data %s", instance.data)
@@ -1,5 +1,8 @@
 import pyblish.api
 
+# Marker for missing values, attribute value can be 'None'
+_MISSING = object()
+
 
 class CollectFrameDataFromAssetEntity(pyblish.api.InstancePlugin):
     """Collect Frame Data From `taskEntity` or `folderEntity` of instance.
@@ -19,17 +22,21 @@ class CollectFrameDataFromAssetEntity(pyblish.api.InstancePlugin):
     ]
     hosts = ["traypublisher"]
 
+    FRAME_DATA_KEYS = (
+        "fps",
+        "frameStart",
+        "frameEnd",
+        "handleStart",
+        "handleEnd",
+    )
+
     def process(self, instance):
-        missing_keys = []
-        for key in (
-            "fps",
-            "frameStart",
-            "frameEnd",
-            "handleStart",
-            "handleEnd",
-        ):
-            if key not in instance.data:
-                missing_keys.append(key)
+        instance_data = instance.data
+        missing_keys = [
+            key
+            for key in self.FRAME_DATA_KEYS
+            if key not in instance_data
+        ]
 
         # Skip the logic if all keys are already collected.
         # NOTE: In editorial is not 'folderEntity' filled, so it would crash
@@ -39,15 +46,16 @@ class CollectFrameDataFromAssetEntity(pyblish.api.InstancePlugin):
 
         keys_set = []
 
-        folder_entity = instance.data["folderEntity"]
-        task_entity = instance.data.get("taskEntity")
+        folder_entity = instance_data["folderEntity"]
+        task_entity = instance_data.get("taskEntity")
         context_attributes = (
             task_entity["attrib"] if task_entity else folder_entity["attrib"]
         )
 
         for key in missing_keys:
-            if key in context_attributes:
-                instance.data[key] = context_attributes[key]
+            value = context_attributes.get(key, _MISSING)
+            if value is not _MISSING:
+                instance_data[key] = value
                 keys_set.append(key)
 
         if keys_set:
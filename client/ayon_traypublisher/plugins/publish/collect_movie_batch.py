@@ -39,10 +39,12 @@ class CollectMovieBatch(
 
         if creator_attributes["add_review_family"]:
             repre["tags"].append("review")
-            instance.data["families"].append("review")
+            families = instance.data["families"]
+            if "review" not in families:
+                families.append("review")
             if not instance.data.get("thumbnailSource"):
                 instance.data["thumbnailSource"] = file_url
 
         instance.data["source"] = file_url
 
-        self.log.debug("instance.data {}".format(instance.data))
+        self.log.debug("instance.data %s", instance.data)
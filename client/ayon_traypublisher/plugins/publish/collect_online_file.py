@@ -11,17 +11,19 @@ class CollectOnlineFile(pyblish.api.InstancePlugin):
     hosts = ["traypublisher"]
 
     def process(self, instance):
-        file = Path(instance.data["creator_attributes"]["path"])
-        review = instance.data["creator_attributes"]["add_review_family"]
+        creator_attributes = instance.data["creator_attributes"]
+        file = Path(creator_attributes["path"])
+        review = creator_attributes["add_review_family"]
         instance.data["review"] = review
         if "review" not in instance.data["families"]:
             instance.data["families"].append("review")
         self.log.info(f"Adding review: {review}")
 
+        ext = file.suffix.lstrip(".")
         instance.data["representations"].append(
             {
-                "name": file.suffix.lstrip("."),
-                "ext": file.suffix.lstrip("."),
+                "name": ext,
+                "ext": ext,
                 "files": file.name,
                 "stagingDir": file.parent.as_posix(),
                 "tags": ["review"] if review else []
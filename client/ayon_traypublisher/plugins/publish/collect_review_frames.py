@@ -19,29 +19,31 @@ class CollectReviewInfo(pyblish.api.InstancePlugin):
     families = ["review"]
     hosts = ["traypublisher"]
 
-    def process(self, instance):
+    FRAME_DATA_KEYS = (
+        "fps",
+        "frameStart",
+        "frameEnd",
+        "handleStart",
+        "handleEnd",
+    )
 
+    def process(self, instance):
+        instance_data = instance.data
         entity = (
-            instance.data.get("taskEntity")
-            or instance.data.get("folderEntity")
+            instance_data.get("taskEntity")
+            or instance_data.get("folderEntity")
         )
-        if instance.data.get("frameStart") is not None or not entity:
+        if instance_data.get("frameStart") is not None or not entity:
             self.log.debug("Missing required data on instance")
             return
 
         context_attributes = entity["attrib"]
         # Store collected data for logging
         collected_data = {}
-        for key in (
-            "fps",
-            "frameStart",
-            "frameEnd",
-            "handleStart",
-            "handleEnd",
-        ):
-            if key in instance.data or key not in context_attributes:
+        for key in self.FRAME_DATA_KEYS:
+            if key in instance_data or key not in context_attributes:
                 continue
             value = context_attributes[key]
             collected_data[key] = value
-            instance.data[key] = value
+            instance_data[key] = value
         self.log.debug("Collected data: {}".format(str(collected_data)))
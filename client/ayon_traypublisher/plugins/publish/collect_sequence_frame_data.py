@@ -50,11 +50,6 @@ class CollectSequenceFrameData(
     def get_frame_data_from_repre_sequence(self, instance):
         repres = instance.data.get("representations")
 
-        entity: dict = (
-            instance.data.get("taskEntity") or instance.data["folderEntity"]
-        )
-        entity_attributes: dict = entity["attrib"]
-
         if repres:
             first_repre = repres[0]
             if "ext" not in first_repre:
@@ -63,10 +58,11 @@ class CollectSequenceFrameData(
                 return
 
             files = first_repre["files"]
-            if not isinstance(files, list):
-                files = [files]
+            # Single file can't form a sequence, skip 'clique' parsing
+            collections = []
+            if isinstance(files, list) and len(files) > 1:
+                collections, _ = clique.assemble(files)
 
-            collections, _ = clique.assemble(files)
             if not collections:
                 # No sequences detected and we can't retrieve
                 # frame range
@@ -77,6 +73,13 @@ class CollectSequenceFrameData(
             collection = collections[0]
             repres_frames = list(collection.indexes)
 
+            # Entity is needed only when frame range can be collected
+            entity: dict = (
+                instance.data.get("taskEntity")
+                or instance.data["folderEntity"]
+            )
+            entity_attributes: dict = entity["attrib"]
+
             return {
                 "frameStart": repres_frames[0],
                 "frameEnd": repres_frames[-1],
@@ -1,7 +1,11 @@
+import logging
 from pprint import pformat
+
 import pyblish.api
 import opentimelineio as otio
 
+from ayon_core.pipeline.publish import KnownPublishError
+
 
 class CollectShotInstance(pyblish.api.InstancePlugin):
     """ Collect shot instances
@@ -16,7 +20,7 @@ class CollectShotInstance(pyblish.api.InstancePlugin):
     hosts = ["traypublisher"]
     families = ["shot"]
 
-    SHARED_KEYS = [
+    SHARED_KEYS = frozenset({
         "folderPath",
         "fps",
         "handleStart",
@@ -30,26 +34,28 @@ class CollectShotInstance(pyblish.api.InstancePlugin):
         "sourceOut",
         "otioClip",
         "workfileFrameStart"
-    ]
+    })
 
     def process(self, instance):
-        creator_identifier = instance.data["creator_identifier"]
-        if "editorial" not in creator_identifier:
+        # Only shots created by editorial creator are processed
+        if instance.data.get("creator_identifier") != "editorial_shot":
             return
 
+        instance_data = instance.data
         # get otio clip object
         otio_clip = self._get_otio_clip(instance)
-        instance.data["otioClip"] = otio_clip
+        instance_data["otioClip"] = otio_clip
 
         # first solve the inputs from creator attr
         data = self._solve_inputs_to_data(instance)
-        instance.data.update(data)
+        instance_data.update(data)
 
         # distribute all shared keys to clips instances
         self._distribute_shared_data(instance)
         self._solve_hierarchy_context(instance)
 
-        self.log.debug(pformat(instance.data))
+        if self.log.isEnabledFor(logging.DEBUG):
+            self.log.debug(pformat(instance_data))
 
     def _get_otio_clip(self, instance):
         """ Converts otio string data.
@@ -73,15 +79,23 @@ class CollectShotInstance(pyblish.api.InstancePlugin):
 
         otio_timeline = context.data["otioTimeline"]
 
-        clips = [
-            clip for clip in otio_timeline.find_clips()
-            if clip.name == otio_clip.name
-            if clip.parent().kind == "Video"
-        ]
-
-        otio_clip = clips.pop()
+        # Last matching clip is used, search from the end and stop
+        #   on first match
+        clip_name = otio_clip.name
+        timeline_clip = next(
+            (
+                clip for clip in reversed(otio_timeline.find_clips())
+                if clip.name == clip_name
+                and clip.parent().kind == "Video"
+            ),
+            None
+        )
+        if timeline_clip is None:
+            raise KnownPublishError(
+                f"Clip '{clip_name}' was not found in editorial timeline."
+            )
 
-        return otio_clip
+        return timeline_clip
 
     def _distribute_shared_data(self, instance):
         """ Distribute all defined keys.
@@ -92,16 +106,16 @@ class CollectShotInstance(pyblish.api.InstancePlugin):
         Args:
             instance (obj): publishing instance
         """
-        context = instance.context
+        instance_data = instance.data
+        instance_id = instance_data["instance_id"]
 
-        instance_id = instance.data["instance_id"]
-
-        if not context.data.get("editorialSharedData"):
-            context.data["editorialSharedData"] = {}
-
-        context.data["editorialSharedData"][instance_id] = {
-            _k: _v for _k, _v in instance.data.items()
-            if _k in self.SHARED_KEYS
+        editorial_shared_data = instance.context.data.setdefault(
+            "editorialSharedData", {}
+        )
+        editorial_shared_data[instance_id] = {
+            key: instance_data[key]
+            for key in self.SHARED_KEYS
+            if key in instance_data
         }
 
     def _solve_inputs_to_data(self, instance):
@@ -141,17 +155,18 @@ class CollectShotInstance(pyblish.api.InstancePlugin):
         Args:
             instance (obj): publishing instance
         """
-        context = instance.context
+        context_data = instance.context.data
+        instance_data = instance.data
 
         final_context = (
-            context.data["hierarchyContext"]
-            if context.data.get("hierarchyContext")
+            context_data["hierarchyContext"]
+            if context_data.get("hierarchyContext")
             else {}
         )
 
         # get handles
-        handle_start = int(instance.data["handleStart"])
-        handle_end = int(instance.data["handleEnd"])
+        handle_start = int(instance_data["handleStart"])
+        handle_end = int(instance_data["handleEnd"])
 
         in_info = {
             "entity_type": "folder",
@@ -159,18 +174,18 @@ class CollectShotInstance(pyblish.api.InstancePlugin):
             "attributes": {
                 "handleStart": handle_start,
                 "handleEnd": handle_end,
-                "frameStart": instance.data["frameStart"],
-                "frameEnd": instance.data["frameEnd"],
-                "clipIn": instance.data["clipIn"],
-                "clipOut": instance.data["clipOut"],
-                "fps": instance.data["fps"]
+                "frameStart": instance_data["frameStart"],
+                "frameEnd": instance_data["frameEnd"],
+                "clipIn": instance_data["clipIn"],
+                "clipOut": instance_data["clipOut"],
+                "fps": instance_data["fps"]
             },
-            "tasks": instance.data["tasks"]
+            "tasks": instance_data["tasks"]
         }
 
-        parents = instance.data.get('parents', [])
+        parents = instance_data.get('parents', [])
 
-        folder_name = instance.data["folderPath"].split("/")[-1]
+        folder_name = instance_data["folderPath"].split("/")[-1]
         actual = {folder_name: in_info}
 
         for parent in reversed(parents):
@@ -186,12 +201,12 @@ class CollectShotInstance(pyblish.api.InstancePlugin):
         final_context = self._update_dict(final_context, actual)
 
         # adding hierarchy context to instance
-        context.data["hierarchyContext"] = final_context
+        context_data["hierarchyContext"] = final_context
 
     def _update_dict(self, ex_dict, new_dict):
-        """ Recursion function
+        """ Update nested data with another nested data.
 
-        Updating nested data with another nested data.
+        Nested levels are processed using a stack instead of recursion.
 
         Args:
             ex_dict (dict): nested data
@@ -200,10 +215,13 @@ class CollectShotInstance(pyblish.api.InstancePlugin):
         Returns:
             dict: updated nested data
         """
-        for key in ex_dict:
-            if key in new_dict and isinstance(ex_dict[key], dict):
-                new_dict[key] = self._update_dict(ex_dict[key], new_dict[key])
-            elif not ex_dict.get(key) or not new_dict.get(key):
-                new_dict[key] = ex_dict[key]
+        stack = [(ex_dict, new_dict)]
+        while stack:
+            ex_item, new_item = stack.pop()
+            for key, ex_value in ex_item.items():
+                if key in new_item and isinstance(ex_value, dict):
+                    stack.append((ex_value, new_item[key]))
+                elif not ex_value or not new_item.get(key):
+                    new_item[key] = ex_value
 
         return new_dict
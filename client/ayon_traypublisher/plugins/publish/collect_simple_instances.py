@@ -50,7 +50,7 @@ class CollectSettingsSimpleInstances(pyblish.api.InstancePlugin):
         self._fill_version(instance, instance_label)
 
         # Store filepaths for validation of their existence
-        source_filepaths = []
+        source_filepaths = set()
         # Make sure there are no representations with same name
         repre_names_counter = {}
         # Store created names for logging
@@ -72,7 +72,7 @@ class CollectSettingsSimpleInstances(pyblish.api.InstancePlugin):
             repre_names,
             representation_files_mapping
         )
-        source_filepaths = list(set(source_filepaths))
+        source_filepaths = list(source_filepaths)
         instance.data["source"] = source
         instance.data["sourceFilepaths"] = source_filepaths
 
@@ -128,25 +128,28 @@ class CollectSettingsSimpleInstances(pyblish.api.InstancePlugin):
         creator_attributes = instance.data["creator_attributes"]
         filepath_items = creator_attributes["representation_files"]
         if not isinstance(filepath_items, list):
-            filepath_items = [filepath_items]
+            filepath_items = (filepath_items, )
 
+        add_representation = instance.data["representations"].append
         source = None
         for filepath_item in filepath_items:
             # Skip if filepath item does not have filenames
-            if not filepath_item["filenames"]:
+            filenames = filepath_item["filenames"]
+            if not filenames:
                 continue
 
+            directory = filepath_item["directory"]
             filepaths = {
-                os.path.join(filepath_item["directory"], filename)
-                for filename in filepath_item["filenames"]
+                os.path.join(directory, filename)
+                for filename in filenames
             }
-            source_filepaths.extend(filepaths)
+            source_filepaths.update(filepaths)
 
             source = self._calculate_source(filepaths)
             representation = self._create_representation_data(
                 filepath_item, repre_names_counter, repre_names
             )
-            instance.data["representations"].append(representation)
+            add_representation(representation)
             representation_files_mapping.append(
                 (filepaths, representation, source)
             )
@@ -188,7 +191,7 @@ class CollectSettingsSimpleInstances(pyblish.api.InstancePlugin):
             os.path.join(item_dir, filename)
             for filename in filenames
         }
-        source_filepaths.extend(filepaths)
+        source_filepaths.update(filepaths)
         # First try to find out representation with same filepaths
         #   so it's not needed to create new representation just for review
         review_representation = None
@@ -264,6 +267,10 @@ class CollectSettingsSimpleInstances(pyblish.api.InstancePlugin):
         }
 
     def _calculate_source(self, filepaths):
+        # Single file can't be a sequence
+        if len(filepaths) == 1:
+            return next(iter(filepaths))
+
         cols, rems = clique.assemble(filepaths)
         if cols:
             source = cols[0].format("{head}{padding}{tail}")
@@ -1,4 +1,5 @@
 import re
+from functools import lru_cache
 
 import pyblish.api
 
@@ -9,6 +10,22 @@ from ayon_core.pipeline.publish import (
 )
 
 
+@lru_cache(maxsize=8)
+def get_compiled_patterns(patterns):
+    """Compile regex patterns only once for the same input.
+
+    Patterns are compiled separately, combining them into one pattern
+        would break on inline flags or duplicated group names.
+
+    Args:
+        patterns (tuple[str, ...]): Regex patterns.
+
+    Returns:
+        tuple[re.Pattern, ...]: Compiled patterns.
+    """
+    return tuple(re.compile(pattern) for pattern in patterns)
+
+
 class ValidateFrameRange(OptionalPyblishPluginMixin,
                          pyblish.api.InstancePlugin):
     """Validating frame range of rendered files against state in DB."""
@@ -23,8 +40,9 @@ class ValidateFrameRange(OptionalPyblishPluginMixin,
     optional = True
     # published data might be sequence (.mov, .mp4) in that counting files
     # doesn't make sense
-    check_extensions = ["exr", "dpx", "jpg", "jpeg", "png", "tiff", "tga",
-                        "gif", "svg"]
+    check_extensions = frozenset({
+        "exr", "dpx", "jpg", "jpeg", "png", "tiff", "tga", "gif", "svg"
+    })
     skip_timelines_check = []  # skip for specific task names (regex)
 
     def process(self, instance):
@@ -42,10 +60,15 @@ class ValidateFrameRange(OptionalPyblishPluginMixin,
             self.log.debug("Instance is creating new folder. Skipping.")
             return
 
-        if (self.skip_timelines_check and
-            any(re.search(pattern, instance.data["task"])
-                for pattern in self.skip_timelines_check)):
+        skip_patterns = get_compiled_patterns(
+            tuple(self.skip_timelines_check)
+        )
+        if any(
+            pattern.search(instance.data["task"])
+            for pattern in skip_patterns
+        ):
             self.log.info("Skipping for {} task".format(instance.data["task"]))
+            return
 
         # Use attributes from task entity if set, otherwise from folder entity
         entity = (
@@ -71,9 +94,7 @@ class ValidateFrameRange(OptionalPyblishPluginMixin,
             return
 
         files = first_repre["files"]
-        if isinstance(files, str):
-            files = [files]
-        frames = len(files)
+        frames = 1 if isinstance(files, str) else len(files)
 
         msg = (
             "Frame duration from DB:'{}' doesn't match number of files:'{}'"
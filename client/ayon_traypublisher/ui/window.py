@@ -47,6 +47,40 @@ class TrayPublisherController(QtPublisherController):
         return self._projects_model.get_project_items(sender)
 
 
+class TrayPublisherProjectsProxy(ProjectSortFilterProxy):
+    """Projects proxy filtering project names by lowered substring."""
+
+    def __init__(self, *args, **kwargs):
+        super(TrayPublisherProjectsProxy, self).__init__(*args, **kwargs)
+        self._name_filter = ""
+
+    def set_name_filter(self, text):
+        name_filter = text.lower()
+        if name_filter == self._name_filter:
+            return
+        self._name_filter = name_filter
+        # Only rows are filtered, columns don't have to be invalidated
+        #   - 'invalidateRowsFilter' is available since Qt 6
+        if hasattr(self, "invalidateRowsFilter"):
+            self.invalidateRowsFilter()
+        else:
+            self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        # Skip name lookup when there is nothing to filter by
+        if self._name_filter:
+            index = self.sourceModel().index(source_row, 0, source_parent)
+            project_name = index.data(PROJECT_NAME_ROLE)
+            if (
+                project_name is not None
+                and self._name_filter not in project_name.lower()
+            ):
+                return False
+        return super(TrayPublisherProjectsProxy, self).filterAcceptsRow(
+            source_row, source_parent
+        )
+
+
 class StandaloneOverlayWidget(QtWidgets.QFrame):
     project_selected = QtCore.Signal(str)
 
@@ -63,9 +97,12 @@ class StandaloneOverlayWidget(QtWidgets.QFrame):
         header_label.setObjectName("ChooseProjectLabel")
         # Create project models and view
         projects_model = ProjectsQtModel(controller)
-        projects_proxy = ProjectSortFilterProxy()
+        projects_proxy = TrayPublisherProjectsProxy()
         projects_proxy.setSourceModel(projects_model)
         projects_proxy.setFilterKeyColumn(0)
+        # Sort once, dynamic sorting keeps the order on refresh
+        #   or filter change
+        projects_proxy.sort(0)
 
         projects_view = QtWidgets.QListView(content_widget)
         projects_view.setObjectName("ChooseProjectView")
@@ -73,6 +110,10 @@ class StandaloneOverlayWidget(QtWidgets.QFrame):
         projects_view.setEditTriggers(
             QtWidgets.QAbstractItemView.NoEditTriggers
         )
+        # All rows have same height, lay them out in batches
+        projects_view.setUniformItemSizes(True)
+        projects_view.setLayoutMode(QtWidgets.QListView.Batched)
+        projects_view.setBatchSize(100)
 
         confirm_btn = QtWidgets.QPushButton("Confirm", content_widget)
         cancel_btn = QtWidgets.QPushButton("Cancel", content_widget)
@@ -106,10 +147,16 @@ class StandaloneOverlayWidget(QtWidgets.QFrame):
         main_layout.addWidget(middle_frame, 2)
         main_layout.addStretch(1)
 
+        # Apply filter only after user stops typing
+        filter_timer = QtCore.QTimer(self)
+        filter_timer.setSingleShot(True)
+        filter_timer.setInterval(180)
+
         projects_view.doubleClicked.connect(self._on_double_click)
         confirm_btn.clicked.connect(self._on_confirm_click)
         cancel_btn.clicked.connect(self._on_cancel_click)
         txt_filter.textChanged.connect(self._on_text_changed)
+        filter_timer.timeout.connect(self._on_filter_timer)
 
         self._projects_view = projects_view
         self._projects_model = projects_model
@@ -117,18 +164,23 @@ class StandaloneOverlayWidget(QtWidgets.QFrame):
         self._cancel_btn = cancel_btn
         self._confirm_btn = confirm_btn
         self._txt_filter = txt_filter
+        self._filter_timer = filter_timer
 
         self._publisher_window = publisher_window
+        self._setting_registry = TrayPublisherRegistry()
         self._project_name = None
 
     def showEvent(self, event):
+        self._cancel_btn.setVisible(self._project_name is not None)
+        super(StandaloneOverlayWidget, self).showEvent(event)
+        # Let the overlay paint before projects are queried from server
+        QtCore.QTimer.singleShot(0, self._refresh_projects)
+
+    def _refresh_projects(self):
         self._projects_model.refresh()
-        # Sort projects after refresh
-        self._projects_proxy.sort(0)
 
-        setting_registry = TrayPublisherRegistry()
         try:
-            project_name = setting_registry.get_item("project_name")
+            project_name = self._setting_registry.get_item("project_name")
         except ValueError:
             project_name = None
 
@@ -145,9 +197,6 @@ class StandaloneOverlayWidget(QtWidgets.QFrame):
                 )
                 self._projects_view.setCurrentIndex(index)
 
-        self._cancel_btn.setVisible(self._project_name is not None)
-        super(StandaloneOverlayWidget, self).showEvent(event)
-
     def _on_double_click(self):
         self.set_selected_project()
 
@@ -158,8 +207,10 @@ class StandaloneOverlayWidget(QtWidgets.QFrame):
         self._set_project(self._project_name)
 
     def _on_text_changed(self):
-        self._projects_proxy.setFilterRegularExpression(
-            self._txt_filter.text())
+        self._filter_timer.start()
+
+    def _on_filter_timer(self):
+        self._projects_proxy.set_name_filter(self._txt_filter.text())
 
     def set_selected_project(self):
         index = self._projects_view.currentIndex()
@@ -178,8 +229,7 @@ class StandaloneOverlayWidget(QtWidgets.QFrame):
         self.setVisible(False)
         self.project_selected.emit(project_name)
 
-        setting_registry = TrayPublisherRegistry()
-        setting_registry.set_item("project_name", project_name)
+        self._setting_registry.set_item("project_name", project_name)
 
 
 class TrayPublishWindow(PublisherWindow):
@@ -5,7 +5,14 @@ from .settings import TraypublisherSettings, DEFAULT_TRAYPUBLISHER_SETTING
 
 class Traypublisher(BaseServerAddon):
     settings_model = TraypublisherSettings
+    # Validated default settings, created on first request
+    _default_settings = None
 
     async def get_default_settings(self):
-        settings_model_cls = self.get_settings_model()
-        return settings_model_cls(**DEFAULT_TRAYPUBLISHER_SETTING)
+        if self._default_settings is None:
+            settings_model_cls = self.get_settings_model()
+            self._default_settings = settings_model_cls(
+                **DEFAULT_TRAYPUBLISHER_SETTING
+            )
+        # Return copy so the cached model can't be modified by caller
+        return self._default_settings.copy(deep=True)
@@ -5,9 +5,14 @@ from ayon_server.settings import (
     folder_types_enum,
     task_types_enum,
 )
-from ayon_server.settings.validators import ensure_unique_names
 from ayon_server.exceptions import BadRequestException
 
+from .validators import (
+    warn_invalid_regex,
+    ensure_unique_item_names,
+    normalize_extensions,
+)
+
 
 class BatchMovieCreatorPlugin(BaseSettingsModel):
     """Allows to publish multiple video files in one go. <br />Name of matching
@@ -29,6 +34,22 @@ class BatchMovieCreatorPlugin(BaseSettingsModel):
         default_factory=list
     )
 
+    @validator("extensions")
+    def validate_extensions(cls, value):
+        return normalize_extensions(value)
+
+
+column_type_enum = [
+    {"value": "text", "label": "Text"},
+    {"value": "number", "label": "Number"},
+    {"value": "decimal", "label": "Decimal"},
+    {"value": "bool", "label": "Boolean"},
+]
+
+
+def _column_type_enum():
+    return column_type_enum
+
 
 class ColumnItemModel(BaseSettingsModel):
     """Allows to publish multiple video files in one go. <br />Name of matching
@@ -43,7 +64,8 @@ class ColumnItemModel(BaseSettingsModel):
 
     type: str = SettingsField(
         title="Type",
-        default=""
+        default="text",
+        enum_resolver=_column_type_enum
     )
 
     default: str = SettingsField(
@@ -61,6 +83,11 @@ class ColumnItemModel(BaseSettingsModel):
         default="^(.*)$"
     )
 
+    @validator("validation_pattern")
+    def validate_pattern(cls, value):
+        warn_invalid_regex(value)
+        return value
+
 
 class ColumnConfigModel(BaseSettingsModel):
     """Allows to publish multiple video files in one go. <br />Name of matching
@@ -69,7 +96,9 @@ class ColumnConfigModel(BaseSettingsModel):
 
     csv_delimiter: str = SettingsField(
         title="CSV delimiter",
-        default=","
+        default=",",
+        min_length=1,
+        max_length=1,
     )
 
     columns: list[ColumnItemModel] = SettingsField(
@@ -79,7 +108,7 @@ class ColumnConfigModel(BaseSettingsModel):
 
     @validator("columns")
     def validate_unique_outputs(cls, value):
-        ensure_unique_names(value)
+        ensure_unique_item_names(value)
         return value
 
 
@@ -103,10 +132,16 @@ class RepresentationItemModel(BaseSettingsModel):
 
     @validator("extensions")
     def validate_extension(cls, value):
-        for ext in value:
-            if not ext.startswith("."):
-                raise BadRequestException(f"Extension must start with '.': {ext}")
-        return value
+        invalid_extensions = [
+            ext
+            for ext in value
+            if not ext.startswith(".")
+        ]
+        if invalid_extensions:
+            raise BadRequestException(
+                f"Extensions must start with '.': {invalid_extensions}"
+            )
+        return [ext.lower() for ext in value]
 
 
 class RepresentationConfigModel(BaseSettingsModel):
@@ -116,7 +151,8 @@ class RepresentationConfigModel(BaseSettingsModel):
 
     tags_delimiter: str = SettingsField(
         title="Tags delimiter",
-        default=";"
+        default=";",
+        min_length=1,
     )
 
     default_tags: list[str] = SettingsField(
@@ -131,7 +167,7 @@ class RepresentationConfigModel(BaseSettingsModel):
 
     @validator("representations")
     def validate_unique_outputs(cls, value):
-        ensure_unique_names(value)
+        ensure_unique_item_names(value)
         return value
 
 
@@ -146,6 +182,11 @@ class FolderTypeRegexItem(BaseSettingsModel):
             "Project's Anatomy folder type to create when regex matches."),
     )
 
+    @validator("regex")
+    def validate_regex(cls, value):
+        warn_invalid_regex(value)
+        return value
+
 
 class TaskTypeRegexItem(BaseSettingsModel):
     _layout = "compact"
@@ -158,6 +199,11 @@ class TaskTypeRegexItem(BaseSettingsModel):
             "New task type to create when regex matches."),
     )
 
+    @validator("regex")
+    def validate_regex(cls, value):
+        warn_invalid_regex(value)
+        return value
+
 
 class FolderCreationConfigModel(BaseSettingsModel):
     """Allow to create folder hierarchy when non-existing."""
@@ -175,7 +221,7 @@ class FolderCreationConfigModel(BaseSettingsModel):
         section="Folder Settings"
     )
     folder_type_regexes: list[FolderTypeRegexItem] = SettingsField(
-        default_factory=FolderTypeRegexItem,
+        default_factory=list,
         description=(
             "Using Regex expressions to create missing folders. \nThose can be used"
             " to define which folder types are used for new folder creation"
@@ -191,7 +237,7 @@ class FolderCreationConfigModel(BaseSettingsModel):
         section="Task Settings"
     )
     task_type_regexes: list[TaskTypeRegexItem] = SettingsField(
-        default_factory=TaskTypeRegexItem,
+        default_factory=list,
         description=(
             "Using Regex expressions to create missing tasks. \nThose can be used"
             " to define which task types are used for new folder+task creation"
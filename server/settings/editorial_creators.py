@@ -1,15 +1,23 @@
+from pydantic import validator
 from ayon_server.settings import (
     BaseSettingsModel,
     SettingsField,
     task_types_enum,
 )
 
+from .validators import warn_invalid_regex
+
 
 class ClipNameTokenizerItem(BaseSettingsModel):
     _layout = "compact"
     name: str = SettingsField("", title="Token name")
     regex: str = SettingsField("", title="Token regex")
 
+    @validator("regex")
+    def validate_regex(cls, value):
+        warn_invalid_regex(value)
+        return value
+
 
 class ShotAddTasksItem(BaseSettingsModel):
     _layout = "compact"
@@ -44,6 +52,10 @@ parent_type_enum = [
 ]
 
 
+def _parent_type_enum():
+    return parent_type_enum
+
+
 class TokenToParentConvertorItem(BaseSettingsModel):
     _layout = "compact"
     # TODO - was 'type' must be renamed in code to `parent_type`
@@ -60,7 +72,7 @@ class TokenToParentConvertorItem(BaseSettingsModel):
     parent_type: str = SettingsField(
         "Project",
         title="Folder Type",
-        enum_resolver=lambda: parent_type_enum
+        enum_resolver=_parent_type_enum
     )
 
 
@@ -82,7 +94,7 @@ class ShotHierarchySubmodel(BaseSettingsModel):
         title="Folder path template"
     )
     parents: list[TokenToParentConvertorItem] = SettingsField(
-        default_factory=TokenToParentConvertorItem,
+        default_factory=list,
         title="Folder path template tokens"
     )
 
@@ -94,6 +106,10 @@ output_file_type = [
 ]
 
 
+def _output_file_type_enum():
+    return output_file_type
+
+
 class ProductTypePresetItem(BaseSettingsModel):
     _layout="compact"
     product_type: str = SettingsField("", title="Product type")
@@ -102,7 +118,7 @@ class ProductTypePresetItem(BaseSettingsModel):
     review: bool = SettingsField(True, title="Review")
     output_file_type: str = SettingsField(
         ".mp4",
-        enum_resolver=lambda: output_file_type
+        enum_resolver=_output_file_type_enum
     )
 
 
@@ -112,7 +128,7 @@ class EditorialSimpleCreatorPlugin(BaseSettingsModel):
         title="Default Variants"
     )
     clip_name_tokenizer: list[ClipNameTokenizerItem] = SettingsField(
-        default_factory=ClipNameTokenizerItem,
+        default_factory=list,
         description="""Clip Name Tokenizer Info.
 
                     Use regex expressions to create tokens.
@@ -130,7 +146,7 @@ class EditorialSimpleCreatorPlugin(BaseSettingsModel):
     )
     shot_add_tasks: list[ShotAddTasksItem] = SettingsField(
         title="Add tasks to shot",
-        default_factory=ShotAddTasksItem,
+        default_factory=list,
         description="The following list of tasks will be added to each created shot."
     )
     product_type_presets: list[ProductTypePresetItem] = SettingsField(
@@ -27,7 +27,7 @@ class TraypublisherSettings(BaseSettingsModel):
     )
     simple_creators: list[SimpleCreatorPlugin] = SettingsField(
         title="Simple Create Plugins",
-        default_factory=SimpleCreatorPlugin,
+        default_factory=list,
     )
     editorial_creators: TraypublisherEditorialCreatorPlugins = SettingsField(
         title="Editorial Creators",
@@ -1,5 +1,8 @@
+from pydantic import validator
 from ayon_server.settings import BaseSettingsModel, SettingsField
 
+from .validators import normalize_extensions
+
 
 class SimpleCreatorPlugin(BaseSettingsModel):
     _layout = "expanded"
@@ -39,6 +42,10 @@ class SimpleCreatorPlugin(BaseSettingsModel):
         title="Extensions"
     )
 
+    @validator("extensions")
+    def validate_extensions(cls, value):
+        return normalize_extensions(value)
+
 
 DEFAULT_SIMPLE_CREATORS = [
     {
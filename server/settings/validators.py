@@ -0,0 +1,59 @@
+import re
+from functools import lru_cache
+
+from ayon_server.logging import logger
+from ayon_server.settings.validators import ensure_unique_names
+
+
+@lru_cache(maxsize=64)
+def warn_invalid_regex(pattern):
+    """Log warning when regex pattern can't be compiled.
+
+    Settings models are validated on each load of stored overrides, so
+        raising would make settings with invalid pattern unloadable.
+        Creators report invalid pattern when it is used. Warning is
+        logged only once per pattern.
+
+    Args:
+        pattern (str): Regex pattern.
+    """
+    try:
+        re.compile(pattern)
+    except re.error as exc:
+        logger.warning(f"Invalid regex pattern '{pattern}': {exc}")
+
+
+def ensure_unique_item_names(items):
+    """Make sure items have unique names.
+
+    Names are compared using a set first. Slower 'ensure_unique_names'
+        is used only to report duplicated name.
+
+    Args:
+        items (list[BaseSettingsModel]): Items with 'name' field.
+
+    Raises:
+        BadRequestException: When there are duplicated names.
+    """
+    if len({item.name for item in items}) != len(items):
+        ensure_unique_names(items)
+
+
+def normalize_extensions(extensions):
+    """Normalize file extensions to lowercase with leading dot.
+
+    Both 'ext' and '.EXT' are converted to '.ext' and duplicates are
+        removed, so file filters don't have to handle the variants.
+
+    Args:
+        extensions (list[str]): Extensions from settings.
+
+    Returns:
+        list[str]: Normalized extensions in original order.
+    """
+    output = {}
+    for ext in extensions:
+        ext = ext.strip().lstrip(".").lower()
+        if ext:
+            output[f".{ext}"] = None
+    return list(output)